@@ -0,0 +1,56 @@
+import itertools
+from timeit import default_timer as timer
+
+# Minimal stand-ins for the discord.py objects MC_Server_Controller talks to.
+# They record every call with a timestamp so the benchmarks can measure edit rates.
+
+DISCORD_MESSAGE_LIMIT = 2000
+
+_message_ids = itertools.count(1)
+
+
+class FakeMessage:
+    def __init__(self, channel, content=None):
+        self.id = next(_message_ids)
+        self.channel = channel
+        self.content = content
+        self.edits = []
+
+    async def edit(self, content=None, **kwargs):
+        self.edits.append((timer(), content))
+        self.content = content
+        return self
+
+    @property
+    def oversized_edits(self):
+        return sum(1 for _, content in self.edits if content is not None and len(content) > DISCORD_MESSAGE_LIMIT)
+
+    def edits_per_minute(self):
+        if len(self.edits) < 2:
+            return 0.0
+        duration = self.edits[-1][0] - self.edits[0][0]
+        if duration == 0:
+            return 0.0
+        return (len(self.edits) - 1) * 60 / duration
+
+
+class FakeChannel:
+    def __init__(self, channel_id=0):
+        self.id = channel_id
+        self.messages = []
+        self.files = []
+
+    async def send(self, content=None, file=None, **kwargs):
+        message = FakeMessage(self, content)
+        self.messages.append(message)
+        if file is not None:
+            self.files.append(file)
+        return message
+
+
+class FakeBot:
+    def __init__(self):
+        self.presence_changes = []
+
+    async def change_presence(self, activity=None, **kwargs):
+        self.presence_changes.append((timer(), activity))
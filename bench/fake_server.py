@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+# Stand-in for a modded Minecraft server, usable as the `start_script` in config.yaml.
+# Behaviour is configured through environment variables (inherited from the bot process):
+#
+#   FAKE_MC_BOOT_SECONDS      time spent "booting" before the online line          (default 3)
+#   FAKE_MC_BOOT_LINES        number of log lines printed while booting             (default 200)
+#   FAKE_MC_FLOOD_RATE        lines per second of log spam once online, 0 = off     (default 0)
+#   FAKE_MC_PLAYER_INTERVAL   seconds between player join/leave events, 0 = off     (default 0)
+#   FAKE_MC_MAX_PLAYERS       max players reported by the `list` command            (default 20)
+#   FAKE_MC_SHUTDOWN_SECONDS  time spent saving the world after `stop`              (default 1)
+#
+# Understood console commands: `list`, `stop`. Anything else gets the vanilla "Unknown command" reply.
+
+import os
+import sys
+import time
+import random
+import threading
+from datetime import datetime
+
+BOOT_SECONDS = float(os.environ.get("FAKE_MC_BOOT_SECONDS", 3))
+BOOT_LINES = int(os.environ.get("FAKE_MC_BOOT_LINES", 200))
+FLOOD_RATE = float(os.environ.get("FAKE_MC_FLOOD_RATE", 0))
+PLAYER_INTERVAL = float(os.environ.get("FAKE_MC_PLAYER_INTERVAL", 0))
+MAX_PLAYERS = int(os.environ.get("FAKE_MC_MAX_PLAYERS", 20))
+SHUTDOWN_SECONDS = float(os.environ.get("FAKE_MC_SHUTDOWN_SECONDS", 1))
+
+PLAYER_POOL = ["Steve", "Alex", "Notch", "Herobrine", "Jeb_", "Dinnerbone", "Grumm", "Kingbdogz"]
+BOOT_MESSAGES = [
+    "[main/INFO] [cpw.mods.modlauncher.Launcher/MODLAUNCHER]: ModLauncher running: args [--launchTarget, forgeserver]",
+    "[main/INFO] [net.minecraftforge.fml.loading.ModDiscoverer/SCAN]: Found mod file {}.jar of type MOD",
+    "[modloading-worker-0/INFO] [net.minecraftforge.common.ForgeMod/FORGEMOD]: Forge mod loading, version 47.2.0",
+    "[main/INFO] [net.minecraft.server.packs.repository.PackRepository/]: Loading datapack mod_{}",
+    "[Worker-Main-2/INFO] [net.minecraft.server.level.progress.LoggerChunkProgressListener/]: Preparing spawn area: {}%",
+    "[main/WARN] [net.minecraft.world.item.crafting.RecipeManager/]: Parsing error loading recipe mod_{}:broken_recipe",
+]
+FLOOD_MESSAGES = [
+    "[Server thread/WARN] [net.minecraft.server.MinecraftServer/]: Can't keep up! Is the server overloaded? Running 2{}ms or 4 ticks behind",
+    "[Server thread/INFO] [net.minecraft.world.entity.Entity/]: Entity minecraft:item@{} moved too quickly!",
+    "[Server thread/WARN] [com.example.somemod.TickHandler/]: Block entity at {} took 12ms to tick",
+]
+
+output_lock = threading.Lock()
+stopping = threading.Event()
+online_players = []
+
+
+def emit(message):
+    line = f"[{datetime.now().strftime('%H:%M:%S')}] {message}\n"
+    with output_lock:
+        sys.stdout.write(line)
+        sys.stdout.flush()
+
+
+def boot():
+    start_time = time.perf_counter()
+    emit("[main/INFO] [minecraft/Main]: Starting minecraft server version 1.20.1")
+    for index in range(BOOT_LINES):
+        emit(random.choice(BOOT_MESSAGES).format(index))
+        time.sleep(BOOT_SECONDS / max(BOOT_LINES, 1))
+    emit(f'[Server thread/INFO] [minecraft/DedicatedServer]: Done ({time.perf_counter() - start_time:.3f}s)! For help, type "help"')
+
+
+def flood():
+    if FLOOD_RATE <= 0:
+        return
+    batch_interval = 0.05
+    batch_size = max(1, int(FLOOD_RATE * batch_interval))
+    count = 0
+    while not stopping.is_set():
+        batch_start = time.perf_counter()
+        lines = "".join(
+            f"[{datetime.now().strftime('%H:%M:%S')}] {random.choice(FLOOD_MESSAGES).format(count + offset)}\n"
+            for offset in range(batch_size)
+        )
+        with output_lock:
+            sys.stdout.write(lines)
+            sys.stdout.flush()
+        count += batch_size
+        time.sleep(max(0, batch_interval - (time.perf_counter() - batch_start)))
+
+
+def players():
+    if PLAYER_INTERVAL <= 0:
+        return
+    while not stopping.wait(PLAYER_INTERVAL):
+        offline = [player for player in PLAYER_POOL if player not in online_players]
+        if offline and (not online_players or random.random() < 0.6):
+            player = random.choice(offline)
+            online_players.append(player)
+            emit(f"[Server thread/INFO] [minecraft/PlayerList]: {player}[/127.0.0.1:{random.randint(40000, 60000)}] logged in with entity id {random.randint(100, 9999)}")
+            emit(f"[Server thread/INFO] [minecraft/MinecraftServer]: {player} joined the game")
+        elif online_players:
+            player = random.choice(online_players)
+            online_players.remove(player)
+            emit(f"[Server thread/INFO] [minecraft/ServerGamePacketListenerImpl]: {player} lost connection: Disconnected")
+            emit(f"[Server thread/INFO] [minecraft/MinecraftServer]: {player} left the game")
+
+
+def shutdown():
+    stopping.set()
+    emit("[Server thread/INFO] [minecraft/MinecraftServer]: Stopping the server")
+    emit("[Server thread/INFO] [minecraft/MinecraftServer]: Stopping server")
+    emit("[Server thread/INFO] [minecraft/MinecraftServer]: Saving players")
+    for player in list(online_players):
+        emit(f"[Server thread/INFO] [minecraft/MinecraftServer]: {player} left the game")
+    online_players.clear()
+    emit("[Server thread/INFO] [minecraft/MinecraftServer]: Saving worlds")
+    for dimension in ["minecraft:overworld", "minecraft:the_nether", "minecraft:the_end"]:
+        emit(f"[Server thread/INFO] [minecraft/MinecraftServer]: Saving chunks for level 'ServerLevel[world]'/{dimension}")
+        time.sleep(SHUTDOWN_SECONDS / 3)
+    emit("[Server thread/INFO] [minecraft/ChunkMap]: ThreadedAnvilChunkStorage: All dimensions are saved")
+
+
+def main():
+    boot()
+    threading.Thread(target=flood, daemon=True).start()
+    threading.Thread(target=players, daemon=True).start()
+    for command in sys.stdin:
+        command = command.strip()
+        if command == "list":
+            emit(f"[Server thread/INFO] [minecraft/DedicatedServer]: There are {len(online_players)} of a max of {MAX_PLAYERS} players online: {', '.join(online_players)}")
+        elif command == "stop":
+            shutdown()
+            return
+        elif command:
+            emit('[Server thread/INFO] [minecraft/DedicatedServer]: Unknown or incomplete command, see below for error')
+    # stdin closed without a stop command, behave like a killed server
+    stopping.set()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,332 @@
+# Benchmark / load-test harness for MC_Server_Controller.
+#
+# Runs the controller against bench/fake_server.py and the stubs in bench/discord_stub.py inside a
+# throwaway directory, so neither a real server nor a Discord token is needed.
+#
+#   python bench/run_benchmarks.py                    # run and compare against bench/baseline.json
+#   python bench/run_benchmarks.py --update-baseline  # run and store the results as the new baseline
+#   python bench/run_benchmarks.py --skip-e2e         # only the in-process benchmarks (no subprocess)
+#
+# Exits with status 1 when a metric is worse than the baseline by more than --tolerance, and with status 2
+# when there is no baseline to compare against (baselines are machine specific, so none is committed).
+
+import argparse
+import asyncio
+import contextlib
+import io
+import json
+import logging
+import os
+import platform
+import statistics
+import stat
+import sys
+import tempfile
+import threading
+import time
+import types
+from collections import deque
+from datetime import datetime, timedelta
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_DIR = os.path.dirname(BENCH_DIR)
+
+# Register lib/ as a bare package so the bench only depends on the controller modules and not on the
+# rest of lib/__init__.py being importable.
+lib_package = types.ModuleType("lib")
+lib_package.__path__ = [os.path.join(REPO_DIR, "lib")]
+sys.modules["lib"] = lib_package
+sys.path.insert(0, BENCH_DIR)
+
+from lib.mc_server_controller import MC_Server_Controller, ServerState
+from discord_stub import FakeBot, FakeChannel, FakeMessage
+
+DEFAULT_BASELINE = os.path.join(BENCH_DIR, "baseline.json")
+SAMPLE_LINE = "[12:34:56] [Server thread/WARN] [net.minecraft.server.MinecraftServer/]: Can't keep up! Is the server overloaded? Running 2500ms or 50 ticks behind\n"
+
+
+#################################################################################
+#                                                                               #
+#                               Helpers                                         #
+#                                                                               #
+#################################################################################
+
+@contextlib.contextmanager
+def quiet():
+    # The controller prints on almost every call, keep that out of the timings and the report
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        yield
+
+
+def median_time(func, repeat):
+    samples = []
+    for _ in range(repeat):
+        start_time = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - start_time)
+    return statistics.median(samples)
+
+
+def metric(value, unit, better):
+    return {"value": value, "unit": unit, "better": better}
+
+
+class FakeProcess:
+    def __init__(self, lines):
+        self.stdout = io.StringIO("".join(lines))
+
+
+def create_workspace(root, args):
+    server_dir = os.path.join(root, "server")
+    os.makedirs(server_dir)
+    with open(os.path.join(server_dir, "server.properties"), "w") as file:
+        file.write("query.port=25565\ndifficulty=normal\nhardcore=false\ngamemode=survival\n")
+
+    fake_server = os.path.join(BENCH_DIR, "fake_server.py")
+    if platform.system().lower() == "windows":
+        start_script = os.path.join(server_dir, "start.bat")
+        with open(start_script, "w") as file:
+            file.write(f'@"{sys.executable}" "{fake_server}"\n')
+    else:
+        start_script = os.path.join(server_dir, "start.sh")
+        with open(start_script, "w") as file:
+            file.write(f'#!/bin/sh\nexec "{sys.executable}" "{fake_server}"\n')
+        os.chmod(start_script, os.stat(start_script).st_mode | stat.S_IEXEC)
+
+    config = {
+        "bot_configs": {"bot_token": "", "bot_prefix": "!", "default_channel": 0},
+        "minecraft_configs": {
+            "server_directory": server_dir,
+            "start_script": start_script,
+            "logs_directory": "logs",
+            "auto_detect_ip": False,
+            "custom_access_point": "127.0.0.1:25565",
+            "online_indicator": 'For help, type "help"',
+            "shutdown_indicator": "Stopping the server",
+        },
+    }
+    with open(os.path.join(root, "config.yaml"), "w") as file:
+        json.dump(config, file)  # JSON is valid YAML
+
+    os.environ["FAKE_MC_BOOT_SECONDS"] = str(args.boot_seconds)
+    os.environ["FAKE_MC_FLOOD_RATE"] = str(args.flood_rate)
+    os.environ["FAKE_MC_PLAYER_INTERVAL"] = "0.5"
+
+
+#################################################################################
+#                                                                               #
+#                               Benchmarks                                      #
+#                                                                               #
+#################################################################################
+
+def bench_read_stdout(mcsc, args):
+    lines = [SAMPLE_LINE] * args.ingest_lines
+    mcsc.server_state = ServerState.STARTING
+    mcsc.last_30_log = deque([], maxlen=30)
+    start_time = time.perf_counter()
+    with quiet():
+        mcsc.read_stdout(FakeProcess(lines))
+    elapsed = time.perf_counter() - start_time
+    return {"read_stdout_lines_per_sec": metric(args.ingest_lines / elapsed, "lines/s", "higher")}
+
+
+def bench_read_stdout_subscribers(mcsc, args):
+    # Dashboard clients that never read, so they fill their queues and get dropped like slow browsers
+    lines = [SAMPLE_LINE] * args.ingest_lines
+    mcsc.server_state = ServerState.STARTING
+    mcsc.last_30_log = deque([], maxlen=30)
+    with quiet():
+        for _ in range(args.subscribers):
+            mcsc.log_broadcaster.subscribe()
+        reader = threading.Thread(target=mcsc.read_stdout, args=(FakeProcess(lines),), daemon=True)
+        start_time = time.perf_counter()
+        reader.start()
+        reader.join(timeout=60)
+    elapsed = time.perf_counter() - start_time
+    if reader.is_alive():
+        raise RuntimeError("read_stdout is blocked by stalled dashboard subscribers")
+    return {"read_stdout_with_subscribers_lines_per_sec": metric(args.ingest_lines / elapsed, "lines/s", "higher")}
+
+
+def bench_live_log_buffer(mcsc, args):
+    mcsc.last_30_log = deque([SAMPLE_LINE] * 30, maxlen=30)
+    message = FakeMessage(FakeChannel())
+    with quiet():
+        elapsed = median_time(lambda: asyncio.run(mcsc.get_live_log_buffer(message)), args.repeat)
+    return {
+        "get_live_log_buffer_ms": metric(elapsed * 1000, "ms", "lower"),
+        "get_live_log_buffer_oversized_edits": metric(message.oversized_edits, "edits", "lower"),
+    }
+
+
+def bench_check_recent_logs(mcsc, args):
+    mcsc.last_30_log = deque([SAMPLE_LINE] * 30, maxlen=30)
+    calls = args.repeat * 50
+
+    async def run():
+        for _ in range(calls):
+            await mcsc.check_recent_logs("All dimensions are saved")
+
+    with quiet():
+        start_time = time.perf_counter()
+        asyncio.run(run())
+        elapsed = time.perf_counter() - start_time
+    return {"check_recent_logs_us": metric(elapsed * 1_000_000 / calls, "us", "lower")}
+
+
+def bench_list_logs(mcsc, args):
+    os.makedirs(mcsc.log_dir, exist_ok=True)
+    first_session = datetime(2024, 1, 1)
+    for index in range(args.log_files):
+        name = (first_session + timedelta(hours=index)).strftime("%d-%m-%Y_%H-%M-%S")
+        open(os.path.join(mcsc.log_dir, f"{name}.log"), "w").close()
+    with quiet():
+        start_time = time.perf_counter()
+        mcsc.session_catalog.rebuild()
+        rebuild_elapsed = time.perf_counter() - start_time
+    # every 7th session crashed, so the filtered listing has something to find
+    with mcsc.session_catalog.lock:
+        for session in mcsc.session_catalog.sessions[::7]:
+            session["crashed"] = True
+        mcsc.session_catalog.reindex()
+        mcsc.session_catalog.compact()
+
+    results = {"session_catalog_rebuild_ms": metric(rebuild_elapsed * 1000, "ms", "lower")}
+    listings = [
+        ("all", {}),
+        ("last_10", {"last_x": "10"}),
+        ("since_crashed", {"since": datetime(2024, 6, 1), "crashed_only": True}),
+    ]
+    for label, kwargs in listings:
+        message = FakeMessage(FakeChannel())
+        with quiet():
+            elapsed = median_time(lambda: asyncio.run(mcsc.list_logs(message, **kwargs)), args.repeat)
+        results[f"list_logs_{label}_ms"] = metric(elapsed * 1000, "ms", "lower")
+        results[f"list_logs_{label}_oversized_edits"] = metric(message.oversized_edits, "edits", "lower")
+    return results
+
+
+def bench_boot_stop(mcsc, args):
+    channel = FakeChannel()
+    boot_message = FakeMessage(channel)
+    stop_message = FakeMessage(channel)
+
+    async def run():
+        start_time = time.perf_counter()
+        await mcsc.start(boot_message)
+        boot_latency = time.perf_counter() - start_time
+        if mcsc.server_state != ServerState.ON:
+            raise RuntimeError("fake server did not reach the online state")
+        # let the flood run against the live reader for a bit before stopping
+        await asyncio.sleep(args.online_seconds)
+        process = mcsc.server_process
+        start_time = time.perf_counter()
+        await mcsc.stop(stop_message)
+        stop_latency = time.perf_counter() - start_time
+        process.wait(timeout=30)
+        return boot_latency, stop_latency
+
+    with quiet():
+        boot_latency, stop_latency = asyncio.run(run())
+    return {
+        "boot_latency_s": metric(boot_latency, "s", "lower"),
+        "boot_overhead_s": metric(boot_latency - args.boot_seconds, "s", "lower"),
+        "stop_latency_s": metric(stop_latency, "s", "lower"),
+        "boot_discord_edits_per_min": metric(boot_message.edits_per_minute(), "edits/min", "lower"),
+        "stop_discord_edits": metric(len(stop_message.edits), "edits", "lower"),
+    }
+
+
+#################################################################################
+#                                                                               #
+#                           Baseline Comparison                                 #
+#                                                                               #
+#################################################################################
+
+def compare(results, baseline, tolerance):
+    regressions = []
+    print(f"{'metric':<40} {'value':>14} {'baseline':>14} {'change':>9}")
+    for name, result in results.items():
+        value = result["value"]
+        line = f"{name:<40} {value:>14.3f}"
+        if name in baseline:
+            base_value = baseline[name]["value"]
+            if base_value == 0:
+                change = 0.0 if value == 0 else float("inf")
+            else:
+                change = (value - base_value) / base_value
+            worse = change < -tolerance if result["better"] == "higher" else change > tolerance
+            line += f" {base_value:>14.3f} {change:>+8.1%}"
+            if worse:
+                line += "  REGRESSION"
+                regressions.append(name)
+        else:
+            line += f" {'-':>14} {'-':>9}"
+        print(f"{line}  {result['unit']}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark MC_Server_Controller against a fake Minecraft server.")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE)
+    parser.add_argument("--update-baseline", action="store_true")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="allowed relative slowdown before flagging a regression")
+    parser.add_argument("--output", help="also write the results as JSON to this path")
+    parser.add_argument("--skip-e2e", action="store_true", help="skip the boot/stop benchmark that spawns the fake server")
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--ingest-lines", type=int, default=200_000)
+    parser.add_argument("--log-files", type=int, default=10_000)
+    parser.add_argument("--boot-seconds", type=float, default=3)
+    parser.add_argument("--online-seconds", type=float, default=2)
+    parser.add_argument("--flood-rate", type=float, default=2000)
+    parser.add_argument("--subscribers", type=int, default=10)
+    args = parser.parse_args()
+
+    original_cwd = os.getcwd()
+    results = {}
+    with tempfile.TemporaryDirectory(prefix="mob_bench_") as root:
+        create_workspace(root, args)
+        os.chdir(root)
+        logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(message)s',
+                            handlers=[logging.FileHandler(os.path.join(root, "bench_server.log"))])
+        try:
+            with quiet():
+                mcsc = MC_Server_Controller(FakeBot())
+            results.update(bench_read_stdout(mcsc, args))
+            results.update(bench_read_stdout_subscribers(mcsc, args))
+            results.update(bench_live_log_buffer(mcsc, args))
+            results.update(bench_check_recent_logs(mcsc, args))
+            results.update(bench_list_logs(mcsc, args))
+            if not args.skip_e2e:
+                results.update(bench_boot_stop(mcsc, args))
+        finally:
+            logging.shutdown()
+            os.chdir(original_cwd)
+
+    baseline = {}
+    if os.path.isfile(args.baseline):
+        with open(args.baseline, "r") as file:
+            baseline = json.load(file)
+    else:
+        print(f"No baseline found at {args.baseline}, run with --update-baseline to store one.")
+
+    regressions = compare(results, baseline, args.tolerance)
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(results, file, indent=2)
+    if args.update_baseline:
+        with open(args.baseline, "w") as file:
+            json.dump(results, file, indent=2)
+        print(f"Baseline written to {args.baseline}")
+        return 0
+    if not baseline:
+        return 2
+    if regressions:
+        print(f"{len(regressions)} regression(s): {', '.join(regressions)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,4 +1,5 @@
 from .mc_server_controller import MC_Server_Controller, ServerState
 from .ping import test_connection
 from .dice import roll_dice
+from .dashboard import start_dashboard
 from teams_manager import TeamsManager
\ No newline at end of file
@@ -0,0 +1,165 @@
+import os
+import json
+import queue
+import threading
+from datetime import datetime
+from timeit import default_timer as timer
+from flask import Flask, Response, jsonify, request, send_from_directory, abort
+from werkzeug.serving import make_server
+from .mc_server_controller import ServerState
+
+#################################################################################
+#                                                                               #
+#                               Web Dashboard                                   #
+#                                                                               #
+#################################################################################
+
+# Local dashboard served next to the bot. Live output comes from the controller's LogBroadcaster, so
+# viewers never touch the server process or its stdout reader. Log downloads go through send_from_directory
+# with conditional responses, which gives HTTP range request support for large logs.
+
+STATE_INTERVAL_SECONDS = 1
+
+DASHBOARD_PAGE = """<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<title>MOB Dashboard</title>
+<style>
+    body { background: #1e1f22; color: #dbdee1; font-family: monospace; margin: 2em; }
+    #log { background: #111214; height: 60vh; overflow-y: scroll; padding: 0.5em; white-space: pre-wrap; }
+    progress { width: 30em; }
+    a { color: #00a8fc; }
+</style>
+</head>
+<body>
+<h2>Server: <span id="state">...</span></h2>
+<p id="details"></p>
+<p><progress id="boot" max="100" value="0"></progress> <span id="boot_text"></span></p>
+<div id="log"></div>
+<h3>Sessions</h3>
+<ul id="sessions"></ul>
+<script>
+    const log = document.getElementById("log");
+    function showState(state) {
+        document.getElementById("state").textContent = state.server_state;
+        document.getElementById("details").textContent =
+            `Access point: ${state.access_point} | Players online: ${state.players_online} (peak ${state.peak_players})`;
+        document.getElementById("boot").value = state.boot_percentage ?? 0;
+        document.getElementById("boot_text").textContent =
+            state.boot_percentage === null ? "" : `${state.boot_percentage.toFixed(1)}% after ${state.boot_elapsed.toFixed(0)}s`;
+    }
+    function addLine(line) {
+        const atBottom = log.scrollTop + log.clientHeight >= log.scrollHeight - 5;
+        log.append(line + "\\n");
+        while (log.childNodes.length > 2000) log.removeChild(log.firstChild);
+        if (atBottom) log.scrollTop = log.scrollHeight;
+    }
+    const stream = new EventSource("/api/stream");
+    stream.onmessage = (event) => addLine(event.data);
+    stream.addEventListener("state", (event) => showState(JSON.parse(event.data)));
+    stream.addEventListener("dropped", () => { addLine("-- fell too far behind, reconnecting --"); });
+    fetch("/api/state").then((response) => response.json()).then(showState);
+    fetch("/api/logs").then((response) => response.json()).then((page) => {
+        for (const session of page.sessions) {
+            const item = document.createElement("li");
+            const link = document.createElement("a");
+            link.href = `/logs/${encodeURIComponent(session.file)}`;
+            link.textContent = session.file;
+            item.append(link, session.crashed ? " CRASHED" : "");
+            document.getElementById("sessions").append(item);
+        }
+    });
+</script>
+</body>
+</html>
+"""
+
+
+def server_state_info(mcsc):
+    boot_elapsed = None
+    boot_percentage = None
+    if mcsc.server_state == ServerState.STARTING and mcsc.boot_start_time is not None:
+        boot_elapsed = timer() - mcsc.boot_start_time
+        boot_percentage = mcsc.boot_percentage(boot_elapsed, mcsc.average_boot_time)
+    live_session = mcsc.live_session or {"players_online": 0, "peak_players": 0}
+    return {
+        "server_state": mcsc.server_state.name,
+        "access_point": mcsc.server_access_point,
+        "average_boot_time": mcsc.average_boot_time,
+        "boot_elapsed": boot_elapsed,
+        "boot_percentage": boot_percentage,
+        "players_online": live_session["players_online"],
+        "peak_players": live_session["peak_players"],
+        "last_log_file": None if mcsc.last_log_file is None else os.path.basename(mcsc.last_log_file)
+    }
+
+
+def create_dashboard(mcsc):
+    app = Flask(__name__)
+
+    @app.route("/")
+    def index():
+        return DASHBOARD_PAGE
+
+    @app.route("/api/state")
+    def state():
+        return jsonify(server_state_info(mcsc))
+
+    @app.route("/api/stream")
+    def stream():
+        subscriber = mcsc.log_broadcaster.subscribe()
+        # Snapshot taken after subscribing so no line is missed, at worst one is sent twice
+        backlog = [] if mcsc.last_30_log is None else list(mcsc.last_30_log)
+
+        def events():
+            try:
+                yield f"event: state\ndata: {json.dumps(server_state_info(mcsc))}\n\n"
+                last_state_sent = timer()
+                for line in reversed(backlog):
+                    yield f"data: {line.rstrip()}\n\n"
+                while True:
+                    if subscriber.dropped and subscriber.queue.empty():
+                        yield "event: dropped\ndata: \n\n"
+                        return
+                    try:
+                        line = subscriber.queue.get(timeout=STATE_INTERVAL_SECONDS)
+                        yield f"data: {line.rstrip()}\n\n"
+                    except queue.Empty:
+                        pass
+                    # Sent on a timer rather than when output goes quiet, a booting server rarely does
+                    if timer() - last_state_sent >= STATE_INTERVAL_SECONDS:
+                        yield f"event: state\ndata: {json.dumps(server_state_info(mcsc))}\n\n"
+                        last_state_sent = timer()
+            finally:
+                mcsc.log_broadcaster.unsubscribe(subscriber)
+
+        return Response(events(), mimetype="text/event-stream", headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
+
+    @app.route("/api/logs")
+    def logs():
+        try:
+            page_number = int(request.args.get("page", 0))
+            page_size = min(max(int(request.args.get("page_size", 50)), 1), 500)
+            since = request.args.get("since")
+            if since is not None:
+                since = datetime.strptime(since, "%Y-%m-%d" if since.count("-") == 2 else "%Y-%m")
+        except ValueError:
+            abort(400)
+        crashed_only = request.args.get("crashed", "false").lower() == "true"
+        sessions, page_number, total_pages, total = mcsc.session_catalog.page(page_number, page_size, since, crashed_only)
+        return jsonify({"sessions": sessions, "page": page_number, "total_pages": total_pages, "total": total})
+
+    @app.route("/logs/<path:file_name>")
+    def download_log(file_name):
+        return send_from_directory(mcsc.log_dir, file_name, conditional=True, mimetype="text/plain")
+
+    return app
+
+
+def start_dashboard(mcsc, host="127.0.0.1", port=5000):
+    server = make_server(host, port, create_dashboard(mcsc), threaded=True)
+    dashboard_thread = threading.Thread(target=server.serve_forever, daemon=True)
+    dashboard_thread.start()
+    print(f" │ Dashboard │ Serving on http://{host}:{port}")
+    return server
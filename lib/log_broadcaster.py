@@ -0,0 +1,46 @@
+import queue
+import threading
+
+#################################################################################
+#                                                                               #
+#                           Log Broadcaster Class                               #
+#                                                                               #
+#################################################################################
+
+# Fans the server output out to any number of subscribers (dashboard clients).
+# read_stdout is the only producer and must never block on a subscriber, so every subscriber gets a
+# bounded queue and is dropped as soon as it falls far enough behind to fill it.
+
+
+class LogSubscriber:
+    def __init__(self, max_queue_size):
+        self.queue = queue.Queue(maxsize=max_queue_size)
+        self.dropped = False
+
+
+class LogBroadcaster:
+    def __init__(self, max_queue_size=1000):
+        self.max_queue_size = max_queue_size
+        self.lock = threading.Lock()
+        # Replaced rather than mutated so publish can iterate it without taking the lock
+        self.subscribers = ()
+
+    def subscribe(self):
+        subscriber = LogSubscriber(self.max_queue_size)
+        with self.lock:
+            self.subscribers = self.subscribers + (subscriber,)
+        print(f" │ LogBroadcaster.subscribe │ {len(self.subscribers)} subscriber(s).")
+        return subscriber
+
+    def unsubscribe(self, subscriber):
+        with self.lock:
+            self.subscribers = tuple(other for other in self.subscribers if other is not subscriber)
+
+    def publish(self, line):
+        for subscriber in self.subscribers:
+            try:
+                subscriber.queue.put_nowait(line)
+            except queue.Full:
+                print(" │ LogBroadcaster.publish │ Dropping a subscriber that fell behind.")
+                subscriber.dropped = True
+                self.unsubscribe(subscriber)
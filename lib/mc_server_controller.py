@@ -14,6 +14,14 @@ import discord
 import urllib.request
 from collections import deque
 import itertools
+import re
+from .session_catalog import SessionCatalog
+from .log_broadcaster import LogBroadcaster
+
+# Only the server's own join/leave messages for valid usernames, so chat like "<Steve> joined the game"
+# or /say output like "[Server] joined the game" is ignored
+PLAYER_JOINED_PATTERN = re.compile(r"\]: (\w{3,16}) joined the game$")
+PLAYER_LEFT_PATTERN = re.compile(r"\]: (\w{3,16}) left the game$")
 
 #################################################################################
 #                                                                               #
@@ -74,6 +82,8 @@ class MC_Server_Controller:
         
         self.server_process = None
         self.log_dir = os.path.join(os.getcwd(), config["minecraft_configs"]["logs_directory"])
+        self.session_catalog = SessionCatalog(self.log_dir)
+        self.log_broadcaster = LogBroadcaster(config.get("dashboard_configs", {}).get("client_queue_size", 1000))
         
         self.online_indicator = config["minecraft_configs"]["online_indicator"]
         self.shutdown_indicator = config["minecraft_configs"]["shutdown_indicator"]
@@ -82,6 +92,10 @@ class MC_Server_Controller:
         self.booting_progress = None
         self.booting_progress_msg = None
         self.last_log_file = None
+        self.last_30_log = None
+        self.boot_start_time = None
+        self.live_session = None
+        self.session_log_handler = None
 
         
     #####################################################################################
@@ -113,6 +127,7 @@ class MC_Server_Controller:
             self.server_state = ServerState.STARTING
             self.last_30_log = deque([], maxlen=30)
             start_time = timer()
+            self.boot_start_time = start_time
             current_datetime = datetime.now()
             formatted_timestamp = current_datetime.strftime("%d-%m-%Y_%H-%M-%S")
             if not os.path.exists(os.path.join(os.getcwd(), self.log_dir)):
@@ -121,14 +136,16 @@ class MC_Server_Controller:
             self.last_log_file = log_file
             open(log_file, "x")
             print(f" │ MCSC.start │ Log file created at: {log_file}")
-            logging.basicConfig(
-                level=logging.INFO,
-                format='%(asctime)s - %(message)s',
-                handlers=[
-                    logging.FileHandler(os.path.join(self.log_dir, f"{formatted_timestamp}.log"))
-                    # logging.StreamHandler()  # Outputs to console as well
-                ]
-            )
+            self.session_catalog.start_session(os.path.basename(log_file), current_datetime)
+            # basicConfig only works once per process, so swap the handler to give every session its own file
+            root_logger = logging.getLogger()
+            if self.session_log_handler is not None:
+                root_logger.removeHandler(self.session_log_handler)
+                self.session_log_handler.close()
+            self.session_log_handler = logging.FileHandler(log_file)
+            self.session_log_handler.setFormatter(logging.Formatter('%(asctime)s - %(message)s'))
+            root_logger.addHandler(self.session_log_handler)
+            root_logger.setLevel(logging.INFO)
             print(f" │ MCSC.start │ Created logger with timestap: {formatted_timestamp}")
             # Creating server process
             self.server_process = subprocess.Popen(
@@ -140,7 +157,7 @@ class MC_Server_Controller:
                 universal_newlines=True,
                 bufsize=1
             )
-            log_thread = threading.Thread(target=self.read_stdout, args=(self.server_process,), daemon=True)
+            log_thread = threading.Thread(target=self.read_stdout, args=(self.server_process, os.path.basename(log_file)), daemon=True)
             log_thread.start()
             while self.server_process is not None:
                 time_elapsed = timer() - start_time
@@ -153,6 +170,7 @@ class MC_Server_Controller:
                     self.update_global_progress_msg(time_elapsed, self.average_boot_time)
                     await boot_message.edit(content=self.booting_progress_msg)
                     self.update_boot_times(time_elapsed)
+                    self.session_catalog.update_session(os.path.basename(self.last_log_file), boot_duration=time_elapsed)
                     break
                 await asyncio.sleep(1)
                 
@@ -167,16 +185,27 @@ class MC_Server_Controller:
     #                        Monitor and Log Server Output                              #
     #####################################################################################
     
-    def read_stdout(self, server_process):
+    def read_stdout(self, server_process, session_file=None):
+        # Owned by this reader, a new session started before this process exits gets its own
+        session = {"players_online": 0, "peak_players": 0, "clean_shutdown": False}
+        self.live_session = session
         with server_process.stdout:
             for line in iter(server_process.stdout.readline, ''):
                 logging.info(line.strip())
                 self.last_30_log.appendleft(line)
+                self.log_broadcaster.publish(line)
                 if self.online_indicator in line:
                     print(" │ MCSC.read_stdout │ Server is ready!")
                     self.server_state = ServerState.ON
+                if "the game" in line:
+                    if PLAYER_JOINED_PATTERN.search(line.rstrip()):
+                        session["players_online"] += 1
+                        session["peak_players"] = max(session["peak_players"], session["players_online"])
+                    elif PLAYER_LEFT_PATTERN.search(line.rstrip()):
+                        session["players_online"] = max(session["players_online"] - 1, 0)
                 if self.shutdown_indicator in line:
                     print(" │ MCSC.read_stdout │ Server Shutdown Detected.")
+                    session["clean_shutdown"] = True
                     if self.server_state == ServerState.ON:
                         try:
                             loop = asyncio.get_event_loop()
@@ -184,6 +213,12 @@ class MC_Server_Controller:
                                 loop.create_task(self.ingame_shutdown())
                         except:
                             asyncio.run(self.ingame_shutdown())
+        # The process has exited, anything other than a shutdown message before that is a crash
+        if session_file is not None:
+            self.session_catalog.end_session(session_file, crashed=not session["clean_shutdown"], peak_players=session["peak_players"])
+        # Stop reporting this session's players, unless a newer session has already replaced it
+        if self.live_session is session:
+            self.live_session = None
                 
     #####################################################################################
     #                      Manage the "booting" message                                 #
@@ -201,15 +236,17 @@ class MC_Server_Controller:
         with open(self.server_mob_info_path, "w") as file:
             json.dump(self.server_mob_info, file)
     
-    def update_global_progress_msg(self, elapsed_time, prev_average_time):
+    def boot_percentage(self, elapsed_time, prev_average_time):
         if self.server_state == ServerState.ON:
-            percentage = 100
+            return 100
+        if elapsed_time > prev_average_time:
+            average_time = elapsed_time + 1
         else:
-            if elapsed_time > prev_average_time:
-                average_time = elapsed_time + 1
-            else:
-                average_time = prev_average_time
-            percentage = (elapsed_time * 100) / average_time
+            average_time = prev_average_time
+        return (elapsed_time * 100) / average_time
+
+    def update_global_progress_msg(self, elapsed_time, prev_average_time):
+        percentage = self.boot_percentage(elapsed_time, prev_average_time)
         if prev_average_time == 0:
             prev_average_time = 'First time boot. No previous data to work with.'
         else:
@@ -367,25 +404,44 @@ class MC_Server_Controller:
     def info(self):
         return
     
-    async def list_logs(self, list_logs_message, last_x=None):
-        all_log_names = os.listdir(self.log_dir)
-        if last_x == None:
-            last_x_logs = all_log_names
-        elif len(all_log_names) > int(last_x):
-            last_x_logs = all_log_names[-int(last_x):]
+    async def list_logs(self, list_logs_message, last_x=None, since=None, crashed_only=False):
+        list_logs_message_text, page_number, total_pages = self.list_logs_page(0, last_x, since, crashed_only)
+        if total_pages > 1:
+            view = LogListView(self, total_pages, last_x, since, crashed_only)
+            await list_logs_message.edit(content=list_logs_message_text, view=view)
+            view.message = list_logs_message
         else:
-            last_x_logs = all_log_names
-        last_x_logs.reverse()
+            await list_logs_message.edit(content=list_logs_message_text)
+
+    def list_logs_page(self, page_number, last_x=None, since=None, crashed_only=False, page_size=10):
+        limit = None if last_x is None else int(last_x)
+        sessions, page_number, total_pages, total = self.session_catalog.page(page_number, page_size, since, crashed_only, limit)
         list_logs_message_text = f"```\n\
         ╔                           ╗\n\
 █═╦═════╣       Existing Logs       ║\n\
   ║     ╚                           ╝\n"
-        for index, name in enumerate(last_x_logs):
-            if index != len(last_x_logs) - 1:
-                list_logs_message_text += f"  ╠══│ {name}\n"
-            else:
-                list_logs_message_text += f"  ╚══│ {name}\n```"
-        await list_logs_message.edit(content=list_logs_message_text)  
+        if len(sessions) == 0:
+            return list_logs_message_text + "  ╚══│ No logs match the given filters.\n```", page_number, total_pages
+        for session in sessions:
+            details = [session["file"]]
+            if session["boot_duration"] is not None:
+                details.append(f"boot {self.format_time(session['boot_duration'])}")
+            if session["size"] is not None:
+                details.append(self.format_size(session["size"]))
+            if session["peak_players"] is not None:
+                details.append(f"peak {session['peak_players']}")
+            if session["crashed"]:
+                details.append("CRASHED")
+            list_logs_message_text += f"  ╠══│ {' │ '.join(details)}\n"
+        list_logs_message_text += f"  ╚══│ Page {page_number + 1}/{total_pages} │ {total} logs\n```"
+        return list_logs_message_text, page_number, total_pages
+
+    def format_size(self, size_to_format):
+        for unit in ["B", "KB", "MB"]:
+            if size_to_format < 1024:
+                return f"{size_to_format:.0f}{unit}" if unit == "B" else f"{size_to_format:.1f}{unit}"
+            size_to_format /= 1024
+        return f"{size_to_format:.1f}GB"
 
     async def get_log(self, channel, log_message, filename):
         if filename.lower() == 'latest':
@@ -444,4 +500,47 @@ class MC_Server_Controller:
                 line_index += 1
             await buffer_message.edit(content=buffer_msg_txt)
         else:
-            await buffer_message.edit(content="```\nThere are no active logs to retrieve.\n```")
\ No newline at end of file
+            await buffer_message.edit(content="```\nThere are no active logs to retrieve.\n```")
+
+
+#################################################################################
+#                                                                               #
+#                       Log List Pagination View Class                          #
+#                                                                               #
+#################################################################################
+
+class LogListView(discord.ui.View):
+    def __init__(self, mcsc, total_pages, last_x=None, since=None, crashed_only=False):
+        super().__init__(timeout=300)
+        self.mcsc = mcsc
+        self.last_x = last_x
+        self.since = since
+        self.crashed_only = crashed_only
+        self.page_number = 0
+        self.total_pages = total_pages
+        self.message = None
+        self.update_buttons()
+
+    def update_buttons(self):
+        self.previous_page.disabled = self.page_number <= 0
+        self.next_page.disabled = self.page_number >= self.total_pages - 1
+
+    async def show_page(self, interaction, page_number):
+        content, self.page_number, self.total_pages = self.mcsc.list_logs_page(page_number, self.last_x, self.since, self.crashed_only)
+        self.update_buttons()
+        await interaction.response.edit_message(content=content, view=self)
+
+    async def on_timeout(self):
+        # Discord keeps showing the buttons after the view stops listening, so grey them out
+        for item in self.children:
+            item.disabled = True
+        if self.message is not None:
+            await self.message.edit(view=self)
+
+    @discord.ui.button(label="Newer", style=discord.ButtonStyle.secondary)
+    async def previous_page(self, interaction, button):
+        await self.show_page(interaction, self.page_number - 1)
+
+    @discord.ui.button(label="Older", style=discord.ButtonStyle.secondary)
+    async def next_page(self, interaction, button):
+        await self.show_page(interaction, self.page_number + 1)
@@ -0,0 +1,191 @@
+import os
+import json
+import zlib
+import threading
+from bisect import bisect_left, insort
+from datetime import datetime
+
+#################################################################################
+#                                                                               #
+#                           Session Catalog Class                               #
+#                                                                               #
+#################################################################################
+
+# Keeps one entry per server session (one log file), sorted by start time and persisted next to the logs.
+# Entries are updated as sessions start, finish booting and end, so listing never has to touch the log
+# directory. Listing is newest first and only slices out the requested page.
+#
+# On disk the catalog is a journal of JSON lines, each holding a session's file name and the fields that
+# changed. Updates only append a line, and the journal is compacted to one line per session on load.
+
+LOG_NAME_FORMAT = "%d-%m-%Y_%H-%M-%S"
+CATALOG_FILE_NAME = "session_catalog.jsonl"
+
+
+class SessionCatalog:
+    def __init__(self, log_dir):
+        self.log_dir = log_dir
+        self.catalog_path = os.path.join(log_dir, CATALOG_FILE_NAME)
+        self.lock = threading.Lock()
+        self.sessions = []
+        self.start_keys = []
+        self.crashed_positions = []
+        self.positions = {}
+
+        if os.path.isfile(self.catalog_path):
+            self.load()
+        else:
+            self.rebuild()
+
+    #####################################################################################
+    #                               Index maintenance                                   #
+    #####################################################################################
+
+    def reindex(self):
+        self.start_keys = [session["start"] for session in self.sessions]
+        self.crashed_positions = [index for index, session in enumerate(self.sessions) if session["crashed"]]
+        self.positions = {session["file"]: index for index, session in enumerate(self.sessions)}
+
+    def load(self):
+        sessions = {}
+        with open(self.catalog_path, 'r') as file:
+            for line in file:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    # Partially written line from the bot being killed mid append
+                    continue
+                sessions.setdefault(record["file"], {}).update(record)
+        with self.lock:
+            self.sessions = sorted(sessions.values(), key=lambda session: session["start"])
+            self.reindex()
+            self.compact()
+
+    def rebuild(self):
+        # Only used when there is no catalog yet, recovers what it can from the existing log files
+        sessions = []
+        if os.path.isdir(self.log_dir):
+            for file_name in os.listdir(self.log_dir):
+                if not file_name.endswith(".log"):
+                    continue
+                try:
+                    start = datetime.strptime(file_name[:-len(".log")], LOG_NAME_FORMAT)
+                except ValueError:
+                    continue
+                file_stats = os.stat(os.path.join(self.log_dir, file_name))
+                sessions.append(self.new_entry(file_name, start, end=datetime.fromtimestamp(file_stats.st_mtime), size=file_stats.st_size))
+        sessions.sort(key=lambda session: session["start"])
+        with self.lock:
+            self.sessions = sessions
+            self.reindex()
+            self.compact()
+        print(f" │ SessionCatalog.rebuild │ Catalogued {len(sessions)} existing log files.")
+
+    def compact(self):
+        if not os.path.exists(self.log_dir):
+            os.makedirs(self.log_dir)
+        temp_path = f"{self.catalog_path}.tmp"
+        with open(temp_path, 'w') as file:
+            for session in self.sessions:
+                file.write(json.dumps(session) + "\n")
+        os.replace(temp_path, self.catalog_path)
+
+    def append(self, record):
+        if not os.path.exists(self.log_dir):
+            os.makedirs(self.log_dir)
+        with open(self.catalog_path, 'a') as file:
+            file.write(json.dumps(record) + "\n")
+
+    def new_entry(self, file_name, start, end=None, size=None):
+        return {
+            "file": file_name,
+            "start": start.isoformat(),
+            "end": None if end is None else end.isoformat(),
+            "size": size,
+            "compressed_size": None,
+            "boot_duration": None,
+            "crashed": False,
+            "peak_players": None
+        }
+
+    #####################################################################################
+    #                           Session lifecycle updates                               #
+    #####################################################################################
+
+    def start_session(self, file_name, start):
+        entry = self.new_entry(file_name, start)
+        with self.lock:
+            if entry["start"] >= (self.start_keys[-1] if self.start_keys else ""):
+                # Normal case, sessions are started in chronological order
+                self.positions[file_name] = len(self.sessions)
+                self.sessions.append(entry)
+                self.start_keys.append(entry["start"])
+            else:
+                insort(self.sessions, entry, key=lambda session: session["start"])
+                self.reindex()
+            self.append(entry)
+
+    def update_session(self, file_name, **fields):
+        with self.lock:
+            if file_name not in self.positions:
+                print(f" │ SessionCatalog.update_session │ Unknown session: {file_name}")
+                return
+            position = self.positions[file_name]
+            session = self.sessions[position]
+            if fields.get("crashed") and not session["crashed"]:
+                insort(self.crashed_positions, position)
+            session.update(fields)
+            self.append({"file": file_name, **fields})
+
+    def end_session(self, file_name, crashed, peak_players):
+        file_path = os.path.join(self.log_dir, file_name)
+        size = None
+        compressed_size = None
+        if os.path.isfile(file_path):
+            size = os.path.getsize(file_path)
+            compressed_size = self.compressed_size(file_path)
+        self.update_session(
+            file_name,
+            end=datetime.now().isoformat(),
+            size=size,
+            compressed_size=compressed_size,
+            crashed=crashed,
+            peak_players=peak_players
+        )
+
+    def compressed_size(self, file_path, chunk_size=1024 * 1024):
+        compressor = zlib.compressobj(6, zlib.DEFLATED, 31)  # gzip container, same size as a .log.gz
+        total = 0
+        with open(file_path, 'rb') as file:
+            for chunk in iter(lambda: file.read(chunk_size), b''):
+                total += len(compressor.compress(chunk))
+        return total + len(compressor.flush())
+
+    #####################################################################################
+    #                                   Listing                                         #
+    #####################################################################################
+
+    def page(self, page_number=0, page_size=10, since=None, crashed_only=False, limit=None):
+        with self.lock:
+            if crashed_only:
+                candidates = self.crashed_positions
+                first = 0 if since is None else bisect_left(candidates, since.isoformat(), key=lambda position: self.start_keys[position])
+            else:
+                candidates = None
+                first = 0 if since is None else bisect_left(self.start_keys, since.isoformat())
+            last = len(self.crashed_positions) if crashed_only else len(self.sessions)
+            total = last - first
+            if limit is not None:
+                total = min(total, limit)
+            total_pages = max(1, -(-total // page_size))
+            page_number = min(max(page_number, 0), total_pages - 1)
+
+            # Newest first, so pages are counted back from the end of the range
+            page_end = last - page_number * page_size
+            page_start = max(last - total, page_end - page_size)
+            if candidates is None:
+                entries = self.sessions[page_start:page_end]
+            else:
+                entries = [self.sessions[position] for position in candidates[page_start:page_end]]
+            entries.reverse()
+            return entries, page_number, total_pages, total
@@ -1,4 +1,4 @@
-from lib import MC_Server_Controller, ServerState, test_connection, roll_dice, TeamsManager
+from lib import MC_Server_Controller, ServerState, test_connection, roll_dice, TeamsManager, start_dashboard
 import time
 import discord
 from discord.ext import commands
@@ -7,6 +7,7 @@ import yaml
 import os
 import json
 from timeit import default_timer as timer
+from datetime import datetime
 
 with open('config.yaml', 'r') as file:
     config = yaml.safe_load(file)
@@ -18,6 +19,10 @@ intents = discord.Intents.all()
 bot = commands.Bot(command_prefix=BOT_PREFIX, intents=intents)
 
 MCSC = MC_Server_Controller(bot)
+
+dashboard_configs = config.get("dashboard_configs", {})
+if dashboard_configs.get("enabled", False):
+    start_dashboard(MCSC, dashboard_configs.get("host", "127.0.0.1"), dashboard_configs.get("port", 5000))
 TeamsManager = TeamsManager()
 
 @bot.event
@@ -109,10 +114,7 @@ async def mc(ctx, *args):
             case "status":
                 await mcStatus(ctx.channel)
             case "list_logs":
-                if len(args) == 1:
-                    await mcListLogs(ctx.channel, None)
-                else:
-                    await mcListLogs(ctx.channel, args[1])
+                await mcListLogs(ctx.channel, *args[1:])
             case "recent_logs":
                 await mcLiveLogBuffer(ctx.channel)
             case "status":
@@ -181,9 +183,29 @@ async def mcGetLog(channel, file_name):
     log_message = await channel.send("```\nRequesting logs from the server controller...\n```")
     await MCSC.get_log(channel, log_message, file_name)
 
-async def mcListLogs(channel, last_x=None):
+async def mcListLogs(channel, *args):
+    # Usage: !mc list_logs [last_x] [--since YYYY-MM[-DD]] [--crashed]
+    last_x = None
+    since = None
+    crashed_only = False
+    args = list(args)
+    try:
+        while args:
+            arg = args.pop(0)
+            if arg == "--crashed":
+                crashed_only = True
+            elif arg == "--since":
+                since_text = args.pop(0)
+                since = datetime.strptime(since_text, "%Y-%m-%d" if since_text.count("-") == 2 else "%Y-%m")
+            else:
+                last_x = int(arg)
+                if last_x < 1:
+                    raise ValueError(arg)
+    except (IndexError, ValueError):
+        await channel.send("```\nInvalid arguments: Usage is [!mc list_logs <last x> --since YYYY-MM(-DD) --crashed], all optional.\n```")
+        return
     list_message = await channel.send("```\nRequesting file names from the server controller...\n```")
-    await MCSC.list_logs(list_message, last_x)
+    await MCSC.list_logs(list_message, last_x, since, crashed_only)
 
 async def mcLiveLogBuffer(channel):
     buffer_msg = await channel.send("```\nRequesting logs from the server controller...\n```")